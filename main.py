@@ -1,155 +1,492 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox
 import sys
 import subprocess
 import os
-import importlib.util
-import importlib.metadata # Added for potentially faster version lookup
+import re
+import importlib.metadata # Package listing, versions, dependencies and RECORDs
 import json
+import csv
+import atexit
+import urllib.request
+import urllib.error
 import threading
-from queue import Queue # For thread communication
+import concurrent.futures
+import multiprocessing
+import functools
+from queue import Queue, Empty # For thread communication
+from collections import namedtuple, deque
+try:
+    from pip._vendor.packaging.markers import Marker # Ships with pip, which this app drives anyway
+except ImportError: # e.g. a venv created --without-pip
+    Marker = None
 
 # --- Helper Functions ---
 
-def run_pip_command(command, show_output=False):
-    """Runs a pip command using subprocess and returns the output or status."""
-    try:
-        # Ensure pip commands target the correct Python environment
-        python_executable = sys.executable
-        full_command = [python_executable, "-m", "pip"] + command
+# Per-distribution metadata, read once per refresh
+DistInfo = namedtuple("DistInfo", ["name", "version", "dependencies", "dist", "metadata_path"])
 
-        if show_output:
-            result = subprocess.run(full_command, capture_output=True, text=True, check=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            return result.stdout.strip()
-        else:
-            subprocess.check_call(full_command, creationflags=subprocess.CREATE_NO_WINDOW)
-            return True
-    except subprocess.CalledProcessError as e:
-        error_message = f"Error running command: {' '.join(command)}\n{e}"
-        if e.stderr:
-            error_message += f"\nStderr: {e.stderr.strip()}"
-        if e.stdout:
-            error_message += f"\nStdout: {e.stdout.strip()}"
-        messagebox.showerror("Pip Error", error_message)
-        return None
-    except FileNotFoundError:
-        messagebox.showerror("Pip Error", f"Command not found: {python_executable} -m pip. Is pip installed and in PATH?")
-        return None
-    except Exception as e:
-        messagebox.showerror("Error", f"An unexpected error occurred: {e}")
-        return None
+SIZE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pylibmgr", "sizes.json")
 
-def get_package_details(package_name):
-    """Gets version, size, and dependencies for a package."""
-    version = "N/A"
-    size = "N/A"
-    dependencies = []
+def _record_state(metadata_path):
+    """(RECORD path, its mtime_ns), or (None, None) if there is no RECORD to key on."""
+    if not metadata_path:
+        return None, None
+    record_path = os.path.join(metadata_path, "RECORD")
+    try:
+        return record_path, os.stat(record_path).st_mtime_ns
+    except OSError:
+        return None, None
+
+class _SizeCache:
+    """Package sizes persisted across runs, keyed by RECORD path and valid while its mtime is unchanged."""
 
-    # Get version and dependencies using pip show
+    def __init__(self, path=SIZE_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock() # store() is called from the size scan thread
+        self._dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._entries = json.load(f) # {record path: [mtime_ns, size in bytes]}
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def store(self, record_path, mtime, size):
+        """Records a size computed elsewhere (e.g. by scan_all_details) against a known RECORD mtime."""
+        with self._lock:
+            self._entries[record_path] = [mtime, size]
+            self._dirty = True
+
+    def snapshot(self):
+        """Plain copy of the entries, for the size scan to read without locking."""
+        with self._lock:
+            return dict(self._entries)
+
+    def save(self):
+        """Writes the cache back to disk (registered with atexit)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path) # Never leave a half-written cache behind
+                self._dirty = False
+            except OSError as e:
+                print(f"Error saving size cache: {e}") # Log error
+
+# Popen options, worked out once. On Windows: no console window for the child.
+# Elsewhere: close_fds=False (our fds are non-inheritable anyway) and no
+# preexec_fn/cwd, which lets CPython launch via posix_spawn instead of fork+exec.
+_POPEN_KW = {"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == "nt" else {"close_fds": False}
+
+_PIP_ENV_COMMANDS = frozenset({"install", "uninstall"}) # Commands that change what is installed
+
+_PIP_DRIVER_DONE = "\x1e__pip_driver_done__ " # Marks the end of one command's output
+
+# Runs in the long-lived pip child: one JSON-encoded argument list per stdin line,
+# pip's output passed straight through, then the done marker with the exit code.
+_PIP_DRIVER_SRC = f"""
+import json, os, sys
+os.environ["PIP_NO_INPUT"] = "1" # stdin carries our commands, pip must never prompt on it
+from pip._internal.cli.main import main
+for line in sys.stdin:
     try:
-        output = run_pip_command(["show", package_name], show_output=True)
-        if output:
-            details = {}
-            for line in output.splitlines():
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    details[key.strip()] = value.strip()
-
-            version = details.get("Version", "N/A")
-            dependencies = details.get("Requires", "").split(", ") if details.get("Requires") else []
-
-            # Get size (more reliable via pip show if location is available)
-            location = details.get("Location")
-            if location:
-                package_path = os.path.join(location, package_name.replace('-', '_')) # Handle hyphens vs underscores
-                # Try common variations if the direct path doesn't exist
-                if not os.path.exists(package_path):
-                     package_path = os.path.join(location, package_name)
-                if not os.path.exists(package_path) and os.path.exists(location):
-                     # Fallback: check top-level modules/packages in the location
-                     potential_dirs = [d for d in os.listdir(location) if os.path.isdir(os.path.join(location, d))]
-                     for d in potential_dirs:
-                         if d.lower() == package_name.lower().replace('-', '_'):
-                             package_path = os.path.join(location, d)
-                             break
-
-                if os.path.exists(package_path) and os.path.isdir(package_path):
-                    total_size = 0
-                    try:
-                        for dirpath, dirnames, filenames in os.walk(package_path):
-                            for f in filenames:
-                                fp = os.path.join(dirpath, f)
-                                if not os.path.islink(fp): # Avoid double counting links
-                                    total_size += os.path.getsize(fp)
-                        size = f"{total_size / (1024 ** 2):.2f} MB"
-                    except OSError:
-                        size = "Error reading size"
+        rc = main(json.loads(line))
+    except SystemExit as e:
+        rc = 0 if e.code is None else e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"ERROR: {{e}}")
+        rc = 1
+    sys.stderr.flush()
+    print({_PIP_DRIVER_DONE!r} + json.dumps({{"rc": rc}}), flush=True)
+"""
+
+class _PipDriver:
+    """A pip interpreter started ahead of the next command, so the command skips Python + pip startup."""
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock() # One command at a time over the pipe
+        self._closing = False # Set by close(); the running command stops the driver when done
+
+    def start(self):
+        """Starts the child (pip's imports happen there, in the background) if it isn't running."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen([sys.executable, "-u", "-c", _PIP_DRIVER_SRC],
+                                          stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                          bufsize=1, text=True, encoding="utf-8", errors="replace",
+                                          env=dict(os.environ, PYTHONIOENCODING="utf-8"), **_POPEN_KW)
+
+    def run(self, command, on_line):
+        """Runs one pip command, handing each output line to on_line; returns pip's exit code."""
+        with self._lock:
+            self.start()
+            try:
+                self._proc.stdin.write(json.dumps(command) + "\n")
+                self._proc.stdin.flush()
+                for line in self._proc.stdout:
+                    if line.startswith(_PIP_DRIVER_DONE):
+                        rc = json.loads(line[len(_PIP_DRIVER_DONE):])["rc"]
+                        break
+                    on_line(line)
                 else:
-                     size = "N/A (Dir not found)" # Indicate path issue
+                    raise OSError("pip driver exited unexpectedly")
+            except OSError:
+                self._stop()
+                raise
+            # pip's pkg_resources backend (Python <= 3.10) reads the installed set once at
+            # import, so after install/uninstall the next command needs a fresh pip. That also
+            # covers pip replacing its own files, which it can't safely keep running after.
+            if self._closing or command[0] in _PIP_ENV_COMMANDS:
+                self._stop()
+                if not self._closing:
+                    self.start() # Its imports overlap with whatever the user does next
+            return rc
+
+    def close(self):
+        """Stops the driver, or if a command is running, has it stop once pip is done.
+
+        pip is never killed mid-command, which could leave site-packages half-written.
+        """
+        self._closing = True
+        if self._lock.acquire(blocking=False): # Idle
+            try:
+                self._stop()
+            finally:
+                self._lock.release()
 
-    except Exception:
-        # Fallback for version if pip show fails (less reliable)
-        try:
-            version = importlib.metadata.version(package_name)
-        except importlib.metadata.PackageNotFoundError:
-            # If pip show failed, try importlib.metadata as a fallback for version
-            if version == "N/A":
-                try:
-                    version = importlib.metadata.version(package_name)
-                except importlib.metadata.PackageNotFoundError:
-                    version = "N/A" # Still not found
-                except Exception:
-                    version = "Error getting version" # Different error
-        except Exception as e:
-             # Catch potential errors in pip show execution itself
-             version = "Error"
-             size = "Error"
-             dependencies = ["Error fetching details"]
-             print(f"Error in get_package_details for {package_name}: {e}") # Log error
+    def _stop(self):
+        """Ends the idle child (the caller holds the lock)."""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close() # Ends the driver loop
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+                self._proc.wait() # Reap it, no zombie
+            self._proc.stdout.close()
+            self._proc = None
 
-    return version, size, dependencies
+_pip_driver = _PipDriver()
 
+def run_pip_streaming(command, on_line):
+    """Runs a pip command, handing each line of its output to on_line as pip prints it.
 
-def get_installed_packages():
-    """Gets a list of installed packages using pip list."""
-    output = run_pip_command(["list", "--format=json"], show_output=True)
-    if output:
-        try:
-            return json.loads(output)
-        except json.JSONDecodeError:
-            messagebox.showerror("Error", "Failed to parse pip list output.")
-            return []
-    return []
-
-def get_outdated_packages():
-    """Gets a list of outdated packages using pip list."""
-    output = run_pip_command(["list", "--outdated", "--format=json"], show_output=True)
-    if output:
+    Returns (success, tail) where tail is the last few output lines, for error reporting.
+    """
+    tail = deque(maxlen=20)
+
+    def handle_line(line):
+        line = line.rstrip()
+        if line:
+            tail.append(line)
+            on_line(line)
+
+    try:
+        rc = _pip_driver.run(command, handle_line)
+    except OSError as e:
+        return False, list(tail) + [f"Could not run pip with {sys.executable}: {e}"]
+    return rc == 0, list(tail)
+
+_REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+@functools.lru_cache(maxsize=None) # The same few markers recur across packages
+def _marker_applies(marker):
+    """Whether a Requires-Dist environment marker holds here, with no extras requested (as pip show evaluates it)."""
+    if Marker is None: # Can't evaluate it, only skip extras-only requirements
+        return "extra" not in marker
+    try:
+        return Marker(marker).evaluate({"extra": ""})
+    except Exception as e: # Malformed marker: keep the dependency rather than hide it
+        print(f"Error evaluating marker {marker!r}: {e}") # Log error
+        return True
+
+def _requirement_names(requires):
+    """Extracts the names of the dependencies that apply here from Requires-Dist entries, like pip show."""
+    names = []
+    for requirement in requires or []:
+        spec, _, marker = requirement.partition(";")
+        marker = marker.strip()
+        if marker and not _marker_applies(marker):
+            continue
+        match = _REQUIREMENT_NAME_RE.match(spec)
+        if match and match.group(1) not in names:
+            names.append(match.group(1))
+    return names
+
+def _dir_size(path):
+    """Sums file sizes under a directory using os.scandir (cached stat, no symlinks followed)."""
+    total_size = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_symlink(): # Avoid double counting links
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total_size += entry.stat(follow_symlinks=False).st_size
+    return total_size
+
+def _top_level_size(dist):
+    """Sizes a distribution from its top-level packages on disk (for installs without a RECORD)."""
+    top_level = dist.read_text("top_level.txt")
+    if not top_level:
+        return None
+    total_size = 0
+    for name in top_level.split():
+        package_path = dist.locate_file(name)
+        if os.path.isdir(package_path):
+            total_size += _dir_size(package_path)
+        elif os.path.isfile(f"{package_path}.py"): # Single-module distribution
+            total_size += os.path.getsize(f"{package_path}.py")
+    return total_size
+
+def _record_size(record):
+    """Sums the size column of a RECORD file.
+
+    Rows without a size (RECORD itself, bytecode compiled at install time) are skipped.
+    """
+    return sum(int(row[2]) for row in csv.reader(record.splitlines()) if len(row) > 2 and row[2].isdigit())
+
+def _dist_size(dist):
+    """Sums the size of every installed file listed in a distribution's RECORD."""
+    record = dist.read_text("RECORD")
+    if record is not None: # One file read, no stat calls
+        return _record_size(record)
+    files = dist.files # e.g. egg-info installed-files.txt, which lists files without sizes
+    if files is None: # No RECORD / installed-files.txt to go by
+        return _top_level_size(dist)
+    total_size = 0
+    for f in files:
+        if f.size is not None:
+            total_size += f.size
+            continue
         try:
-            # Pip might return empty string or non-json on no outdated packages
-            if not output.strip():
-                return []
-            return json.loads(output)
-        except json.JSONDecodeError:
-            # Handle cases where pip might output warnings before JSON
+            file_path = dist.locate_file(f)
+            if not os.path.islink(file_path): # Avoid double counting links
+                total_size += os.stat(file_path).st_size
+        except OSError:
+            pass # Listed but missing on disk (e.g. .pyc never written)
+    return total_size
+
+def _normalize_name(name):
+    """Normalizes a distribution name (PEP 503) so pip list and metadata names match."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def _dist_info(dist):
+    """Builds the DistInfo for one distribution (None if it has no name)."""
+    metadata = dist.metadata # Parsed on every access, so only once per distribution
+    name = metadata["Name"]
+    if not name:
+        return None
+    requires = metadata.get_all("Requires-Dist")
+    if requires is None: # Old egg-info installs keep them in requires.txt instead
+        requires = dist.requires
+    # importlib.metadata has no public accessor for the .dist-info directory
+    metadata_path = getattr(dist, "_path", None)
+    return DistInfo(name, metadata["Version"], _requirement_names(requires), dist,
+                    str(metadata_path) if metadata_path else None)
+
+def build_metadata_cache():
+    """Reads every installed distribution's metadata once: {normalized name: DistInfo}."""
+    meta_cache = {}
+    for dist in importlib.metadata.distributions():
+        info = _dist_info(dist)
+        if info is None:
+            continue
+        key = _normalize_name(info.name)
+        if key not in meta_cache: # First one on sys.path wins, as for imports
+            meta_cache[key] = info
+    return meta_cache
+
+def list_installed_fast(meta_cache=None):
+    """Lists installed packages as pip list would ([{"name", "version"}]), without running pip."""
+    if meta_cache is None:
+        meta_cache = build_metadata_cache()
+    packages = [{"name": info.name, "version": info.version} for info in meta_cache.values()]
+    packages.sort(key=lambda pkg: pkg["name"].lower()) # Same order as pip list
+    return packages
+
+def scan_installed_packages():
+    """Returns (packages, meta_cache) for a refresh. Runs in the process pool."""
+    meta_cache = build_metadata_cache() # One metadata sweep serves the list and every later selection
+    return list_installed_fast(meta_cache), meta_cache
+
+def _format_size(total_size):
+    return f"{total_size / (1024 ** 2):.2f} MB" if total_size is not None else "N/A (Dir not found)"
+
+def _scan_package_size(info, known_sizes):
+    """(size, cache_entry) for one package; cache_entry is (record_path, mtime, bytes) if freshly computed."""
+    record_path, mtime = _record_state(info.metadata_path)
+    entry = known_sizes.get(record_path) if record_path else None
+    if entry and entry[0] == mtime:
+        return _format_size(entry[1]), None
+    try:
+        total_size = _dist_size(info.dist)
+    except Exception as e:
+        print(f"Error reading size for {info.name}: {e}") # Log error
+        return "Error reading size", None
+    cache_entry = (record_path, mtime, total_size) if record_path and total_size is not None else None
+    return _format_size(total_size), cache_entry
+
+def scan_all_details(infos, known_sizes, max_workers=16, chunk_size=8):
+    """Sizes every package, reading RECORDs on a thread pool (file reads release the GIL).
+
+    known_sizes is a _SizeCache snapshot; packages whose RECORD is unchanged are not re-read.
+    Yields one list of (info, size, cache_entry) per chunk of packages, in order, as chunks finish.
+    """
+    # Executor.map has no chunking for threads, so hand each task a slice
+    chunks = [infos[i:i + chunk_size] for i in range(0, len(infos), chunk_size)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda chunk: [_scan_package_size(info, known_sizes) for info in chunk], chunks)
+        for chunk, chunk_results in zip(chunks, results):
+            yield [(info, size, cache_entry) for info, (size, cache_entry) in zip(chunk, chunk_results)]
+
+
+PYPI_JSON_URL = "https://pypi.org/pypi/{name}/json"
+PYPI_INDEX_URLS = frozenset({"https://pypi.org/simple", "https://pypi.python.org/simple"})
+_PIP_INDEX_OPTIONS = ("index-url", "extra-index-url", "find-links") # Where else pip may look for packages
+
+# PEP 440's version pattern (public/local, case-insensitive, with its spelling variants)
+_VERSION_RE = re.compile(r"""
+    ^\s*v?
+    (?:(?P<epoch>\d+)!)?
+    (?P<release>\d+(?:\.\d+)*)
+    (?:[-_.]?(?P<pre_l>alpha|beta|preview|pre|rc|a|b|c)[-_.]?(?P<pre_n>\d+)?)?
+    (?:-(?P<post_n1>\d+)|[-_.]?(?P<post_l>post|rev|r)[-_.]?(?P<post_n2>\d+)?)?
+    (?:[-_.]?(?P<dev_l>dev)[-_.]?(?P<dev_n>\d+)?)?
+    (?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?
+    \s*$""", re.VERBOSE | re.IGNORECASE)
+_PRE_RELEASE_RANK = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+def _version_key(version):
+    """Sort key ordering PEP 440 versions as packaging.version does (None if it isn't one).
+
+    Local labels (+cpu etc.) are ignored; PyPI never reports them.
+    """
+    match = _VERSION_RE.match(version)
+    if not match:
+        return None
+    release = [int(part) for part in match.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0: # 1.0 == 1.0.0
+        release.pop()
+    post = match.group("post_n1") or match.group("post_n2") or ("0" if match.group("post_l") else None)
+    dev = match.group("dev_n") or ("0" if match.group("dev_l") else None)
+    if match.group("pre_l"):
+        pre = (_PRE_RELEASE_RANK[match.group("pre_l").lower()], int(match.group("pre_n") or 0))
+    elif dev is not None and post is None:
+        pre = (-1, 0) # 1.0.dev0 comes before 1.0a0
+    else:
+        pre = (3, 0) # A final release comes after its pre-releases
+    return (int(match.group("epoch") or 0), tuple(release), pre,
+            -1 if post is None else int(post), # 1.0 < 1.0.post0
+            float("inf") if dev is None else int(dev)) # 1.0.post0.dev0 < 1.0.post0
+
+def _is_newer(latest, installed):
+    """PEP 440 comparison without needing packaging (plain inequality for versions it can't parse)."""
+    latest_key, installed_key = _version_key(latest), _version_key(installed)
+    if latest_key is None or installed_key is None:
+        return latest != installed
+    return latest_key > installed_key
+
+def _fetch_latest_version(package_name):
+    """Latest release of a package per PyPI's JSON API (None if PyPI doesn't know it)."""
+    try:
+        with urllib.request.urlopen(PYPI_JSON_URL.format(name=package_name), timeout=10) as response:
+            return json.load(response)["info"]["version"]
+    except urllib.error.HTTPError as e:
+        if e.code == 404: # Local / private package
+            return None
+        raise
+
+def _uses_public_pypi_only():
+    """True if pip is configured (config files or PIP_* variables) to fetch from public PyPI and nothing else."""
+    lines = []
+    success, _ = run_pip_streaming(["config", "list"], lines.append)
+    if not success: # Can't tell, so assume it isn't
+        return False
+    values = []
+    for line in lines: # e.g. global.index-url='https://...'
+        key, sep, value = line.partition("=")
+        if sep and key.rsplit(".", 1)[-1] in _PIP_INDEX_OPTIONS:
+            values.extend(value.strip("'\"").replace("\\n", " ").split())
+    for option in _PIP_INDEX_OPTIONS:
+        values.extend(os.environ.get(f"PIP_{option.replace('-', '_').upper()}", "").split())
+    return all(value.rstrip("/") in PYPI_INDEX_URLS for value in values)
+
+def _pip_outdated_packages(packages):
+    """Outdated packages per pip list --outdated, which asks pip's configured indexes (None if it failed)."""
+    lines = []
+    success, tail = run_pip_streaming(["list", "--outdated", "--format=json", "--disable-pip-version-check"], lines.append)
+    listed = None
+    for line in lines:
+        if line.startswith("["): # The JSON is one line, among any warnings pip prints
             try:
-                # Find the start of the JSON array
-                json_start_index = output.find('[')
-                if json_start_index != -1:
-                    json_output = output[json_start_index:]
-                    return json.loads(json_output)
-                else:
-                     messagebox.showwarning("Pip Warning", f"Could not parse outdated packages list. Output:\n{output}")
-                     return []
-            except json.JSONDecodeError:
-                 messagebox.showerror("Error", f"Failed to parse pip list --outdated output even after searching for JSON.\nOutput:\n{output}")
-                 return []
-    # Return empty list if command failed or returned None
-    return []
+                listed = json.loads(line)
+            except ValueError:
+                pass
+    if not success or listed is None:
+        print("Error running pip list --outdated:\n" + "\n".join(tail)) # Log error
+        return None
+    installed = {_normalize_name(pkg["name"]): pkg for pkg in packages}
+    outdated = []
+    for pkg in listed:
+        match = installed.get(_normalize_name(pkg["name"]))
+        if match is not None:
+            outdated.append({"name": match["name"], "version": pkg["version"], "latest_version": pkg["latest_version"]})
+    return outdated
+
+def get_outdated_packages(packages, on_outdated=None, max_workers=16):
+    """Checks packages ([{"name", "version"}]) against PyPI in parallel.
+
+    If pip is set up to use another index (or extra ones), pip list --outdated is asked
+    instead: package names must not leak to public PyPI, nor a public namesake count as
+    an update. Returns (outdated, failures): failures counts the packages that could not
+    be checked, and outdated is None if none could. on_outdated is called (from this
+    thread) with each outdated package as soon as it is found.
+    """
+    if not _uses_public_pypi_only():
+        outdated = _pip_outdated_packages(packages)
+        if outdated is None:
+            return None, len(packages)
+        outdated.sort(key=lambda pkg: pkg["name"].lower())
+        if on_outdated:
+            for outdated_pkg in outdated:
+                on_outdated(outdated_pkg)
+        return outdated, 0
+
+    outdated = []
+    failures = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch_latest_version, pkg["name"]): pkg for pkg in packages}
+        for future in concurrent.futures.as_completed(futures):
+            pkg = futures[future]
+            try:
+                latest_version = future.result()
+            except (OSError, ValueError, KeyError) as e: # Network trouble or an odd response
+                print(f"Error checking {pkg['name']} on PyPI: {e}") # Log error
+                failures += 1
+                continue
+            if latest_version and _is_newer(latest_version, pkg["version"]):
+                outdated_pkg = {"name": pkg["name"], "version": pkg["version"], "latest_version": latest_version}
+                outdated.append(outdated_pkg)
+                if on_outdated:
+                    on_outdated(outdated_pkg)
+    if packages and failures == len(packages): # Most likely offline
+        return None, failures
+    outdated.sort(key=lambda pkg: pkg["name"].lower())
+    return outdated, failures
 
 
 # --- GUI Application Class ---
 
+INITIAL_VISIBLE_ROWS = 50 # Rows rendered before the tree has been laid out
+
 class LibraryManagerApp:
     def __init__(self, root):
         self.root = root
@@ -193,16 +530,37 @@ class LibraryManagerApp:
         self.tree.column("Dependencies", width=300, anchor="w", stretch=tk.YES)
 
         # Scrollbars
-        vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
+        # The tree only ever holds the rows in view, so the vertical scrollbar
+        # drives our own window over self._all_pkgs instead of tree.yview
+        self.vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self._on_vscroll)
         hsb = ttk.Scrollbar(self.tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
 
-        vsb.pack(side="right", fill="y")
+        self.vsb.pack(side="right", fill="y")
         hsb.pack(side="bottom", fill="x")
         self.tree.pack(fill="both", expand=True)
 
+        # --- Virtual List State ---
+        self._all_pkgs = [] # Every package row: dicts with name, version, size, deps, outdated
+        self._pkg_index = {} # name -> index into self._all_pkgs
+        self._view_start = 0 # Index of the first rendered row
+        self._selected_name = None # Survives its row being scrolled out of the tree
+        # Estimates until _measure_rows reads them off a laid-out row
+        self._row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        self._rows_top = self._row_height # y of the first row, i.e. the heading's height
+        self._rows_measured = False
+
+        self.tree.tag_configure("outdated_row", background="#ffe4b5")
+
         # Bind selection event to load details
         self.tree.bind("<<TreeviewSelect>>", self.on_package_select)
+        # Re-render on resize and handle scrolling ourselves
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
 
         # --- Bottom Frame Widgets (Actions) ---
         self.refresh_button = ttk.Button(self.bottom_frame, text="Refresh List", command=self.refresh_package_list_threaded)
@@ -218,110 +576,312 @@ class LibraryManagerApp:
         self.uninstall_button.pack(side="right", padx=5)
 
         # --- Status Bar ---
-        self.status_var = tk.StringVar()
+        self.status_var = tk.StringVar(value="Ready.")
         self.status_bar = ttk.Label(root, textvariable=self.status_var, relief=tk.SUNKEN, anchor="w", padding="2 5")
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-        self.set_status("Ready.")
+
+        # --- Worker Pool ---
+        # Metadata parsing is CPU-bound Python, so it runs in persistent worker
+        # processes (no GIL contention with the UI). Threads + the queue below
+        # are kept for pip subprocess I/O. Workers are spawned, not forked: a forked
+        # worker would inherit the pip driver's stdin pipe (so closing ours never
+        # reaches it) and a copy of a process with Tk loaded.
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                                            mp_context=multiprocessing.get_context("spawn"))
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        _pip_driver.start() # Pays pip's startup once, while the list loads
+
+        # Sizes from earlier runs; only packages whose RECORD changed get re-sized
+        self._size_cache = _SizeCache()
+        atexit.register(self._size_cache.save)
 
         # --- Threading Queue ---
         self.queue = Queue()
-        self.root.after(100, self.process_queue) # Check queue periodically
+        self._closed = False # Set by on_close; nothing may wake the main loop after that
+        self._meta_cache = {} # Filled by each refresh, see build_metadata_cache
+        # Workers wake the main loop with <<QueueMsg>> instead of us polling
+        self.root.bind("<<QueueMsg>>", lambda e: self._drain_queue())
+        self.root.after_idle(self._drain_queue) # Anything posted before mainloop started
 
         # --- Initial Population ---
         self.refresh_package_list_threaded()
 
     def set_status(self, message):
-        self.status_var.set(message)
-        self.root.update_idletasks() # Ensure status updates immediately
+        """Updates the status bar via the queue, so it is safe from any thread (Tk redraws it when idle)."""
+        self._post("status", message)
 
     def clear_tree(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+    # --- Virtual List ---
+
+    @staticmethod
+    def _row_values(pkg):
+        return (pkg["name"], pkg["version"], pkg["size"], pkg["deps"])
+
+    def _visible_row_count(self):
+        """Number of rows that fit in the tree below the heading."""
+        height = self.tree.winfo_height()
+        if height <= 1: # Not laid out yet
+            return INITIAL_VISIBLE_ROWS
+        return max(1, (height - self._rows_top) // self._row_height)
+
+    def _measure_rows(self):
+        """Reads the real row height and heading offset off a rendered row, re-rendering if they changed.
+
+        Theme, font and DPI scaling all affect them, and the style may not set rowheight at all.
+        """
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else ""
+        if not bbox: # Nothing rendered or laid out yet, retried after the next render
+            return
+        self._rows_measured = True
+        _, top, _, height = bbox
+        if (top, height) != (self._rows_top, self._row_height):
+            self._rows_top, self._row_height = top, height
+            self._render_visible_rows()
+
+    def _on_tree_configure(self, event=None):
+        """Re-renders for the new size, then re-measures once Tk has laid the tree out."""
+        self._render_visible_rows()
+        self.tree.after_idle(self._measure_rows)
+
+    def _render_visible_rows(self, event=None):
+        """Makes the tree hold exactly the rows in view, inserting/deleting only the difference."""
+        visible = self._visible_row_count()
+        total = len(self._all_pkgs)
+        self._view_start = max(0, min(self._view_start, total - visible))
+        window = self._all_pkgs[self._view_start:self._view_start + visible]
+        wanted = {pkg["name"] for pkg in window}
+
+        current = self.tree.get_children()
+        stale = [item_id for item_id in current if item_id not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+        # Rows kept from the last render are already in order, only fill the gaps
+        present = set(current).difference(stale)
+        for index, pkg in enumerate(window):
+            if pkg["name"] not in present:
+                self.tree.insert("", index, iid=pkg["name"], values=self._row_values(pkg), # Use name as item ID (iid)
+                                 tags=("outdated_row",) if pkg["outdated"] else ())
+
+        if self._selected_name in wanted and self._selected_name not in self.tree.selection():
+            self.tree.selection_set(self._selected_name)
+
+        if total:
+            self.vsb.set(self._view_start / total, (self._view_start + len(window)) / total)
+        else:
+            self.vsb.set(0, 1)
+
+        if window and not self._rows_measured:
+            self.tree.after_idle(self._measure_rows) # First rows on screen, check the estimate
+
+    def _scroll_to(self, start):
+        start = max(0, min(start, len(self._all_pkgs) - self._visible_row_count()))
+        if start != self._view_start:
+            self._view_start = start
+            self._render_visible_rows()
+
+    def _scroll_by(self, rows):
+        self._scroll_to(self._view_start + rows)
+        return "break" # Keep the Treeview from scrolling its own (partial) contents
+
+    def _on_vscroll(self, *args):
+        """Scrollbar command, following the Tk yview protocol ("moveto" / "scroll")."""
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._all_pkgs)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_row_count()
+            self._scroll_by(step)
+
+    def _on_mousewheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _move_selection(self, step):
+        """Arrow-key navigation that scrolls the window when it reaches an edge."""
+        index = self._pkg_index.get(self.tree.focus())
+        if index is None:
+            return None # Let the Treeview handle it
+        target = index + step
+        if 0 <= target < len(self._all_pkgs):
+            visible = self._visible_row_count()
+            if target < self._view_start:
+                self._scroll_to(target)
+            elif target >= self._view_start + visible:
+                self._scroll_to(target - visible + 1)
+            name = self._all_pkgs[target]["name"]
+            self.tree.focus(name)
+            self.tree.selection_set(name)
+        return "break"
+
+    def _refresh_row(self, name):
+        """Pushes a package's current values to its tree row, if the row is rendered."""
+        if self.tree.exists(name):
+            pkg = self._all_pkgs[self._pkg_index[name]]
+            self.tree.item(name, values=self._row_values(pkg), tags=("outdated_row",) if pkg["outdated"] else ())
+
+    @staticmethod
+    def _new_row(name, version):
+        return {"name": name, "version": version, "size": "...", "deps": "...", "outdated": False}
+
+    def _selected_package(self):
+        """Name of the selected package (even if scrolled out of view), or None."""
+        if self._selected_name in self._pkg_index:
+            return self._selected_name
+        return None
+
+    def on_close(self):
+        """Stops the worker processes along with the window."""
+        self._closed = True # Before destroy, so no worker starts a Tk call during it
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+        _pip_driver.close()
 
     def refresh_package_list_threaded(self):
-        """Starts a thread to get the list of installed packages."""
+        """Submits the installed-package scan to the worker pool."""
         self.set_status("Loading installed packages...")
         self._disable_buttons() # Disable buttons during refresh
-        thread = threading.Thread(target=self._get_packages_worker)
-        thread.start()
+        future = self._pool.submit(scan_installed_packages)
+        future.add_done_callback(self._on_packages_scanned)
 
-    def _get_packages_worker(self):
-        """Worker thread to get package list."""
-        packages = get_installed_packages()
+    def _on_packages_scanned(self, future):
+        """Pool callback (not the main thread): forwards the package list via the queue."""
+        try:
+            packages, meta_cache = future.result()
+        except Exception as e: # Includes CancelledError / BrokenProcessPool on shutdown
+            print(f"Error reading installed packages: {e}") # Log error
+            packages = meta_cache = None
         # Send packages back to main thread via queue
-        self.queue.put(("populate_initial_list", packages))
+        self._post("populate_initial_list", packages, meta_cache)
+
+    def _scan_details(self, infos):
+        """Starts a scan_all_details pass for the given DistInfos on a background thread."""
+        if not infos:
+            return
+        # Size reads are file I/O, so threads (not the process pool) are the right fit
+        thread = threading.Thread(target=self._scan_details_worker, args=(infos, self._size_cache.snapshot()), daemon=True)
+        thread.start()
 
-    def populate_initial_list(self, packages):
-        """Populates the tree with basic info (name, version) in the main thread."""
+    def _scan_details_worker(self, infos, known_sizes):
+        """Worker thread: caches new sizes and forwards details via the queue, a chunk at a time."""
+        try:
+            for chunk in scan_all_details(infos, known_sizes):
+                rows = []
+                for info, size, cache_entry in chunk:
+                    if cache_entry:
+                        self._size_cache.store(*cache_entry)
+                    rows.append((info.name, info.version or "N/A", size, info.dependencies))
+                self._post("update_all_details", rows)
+        except Exception as e:
+            print(f"Error reading package sizes: {e}") # Log error
+
+    def update_all_details(self, rows):
+        """Applies a whole scan's (name, version, size, dependencies) rows in the main thread."""
+        for row in rows:
+            index = self._pkg_index.get(row[0])
+            if index is None: # Dropped by a refresh in the meantime
+                continue
+            pkg = self._all_pkgs[index]
+            pkg["version"], pkg["size"] = row[1], row[2]
+            pkg["deps"] = ", ".join(row[3]) if row[3] else "-"
+            self._refresh_row(row[0]) # No-op if the row is scrolled out of view
+        self.set_status(f"Loaded {len(self._all_pkgs)} packages.")
+
+    # --- Targeted List Updates (after pip commands) ---
+
+    def _remove_package(self, package_name):
+        """Drops one package's row after an uninstall."""
+        index = self._pkg_index.pop(package_name, None)
+        if index is None:
+            return
+        del self._all_pkgs[index]
+        for i in range(index, len(self._all_pkgs)): # Only the rows after it shift
+            self._pkg_index[self._all_pkgs[i]["name"]] = i
+        self._meta_cache.pop(_normalize_name(package_name), None)
+        if self._selected_name == package_name:
+            self._selected_name = None
+        if self.tree.exists(package_name):
+            self.tree.delete(package_name)
+        self._render_visible_rows() # Pulls the next row up into view
+        self.set_status(f"Loaded {len(self._all_pkgs)} packages.")
+
+    def _reconcile_package_list(self):
+        """Rescans installed packages in the worker pool; reconcile_package_list applies the difference."""
+        self.set_status("Updating package list...")
+        future = self._pool.submit(scan_installed_packages)
+        future.add_done_callback(self._on_packages_rescanned)
+
+    def _on_packages_rescanned(self, future):
+        """Pool callback (not the main thread): forwards the rescan via the queue."""
+        try:
+            packages, meta_cache = future.result()
+        except Exception as e: # Includes CancelledError / BrokenProcessPool on shutdown
+            print(f"Error reading installed packages: {e}") # Log error
+            return
+        self._post("reconcile_package_list", packages, meta_cache)
+
+    def reconcile_package_list(self, packages, meta_cache):
+        """Diffs a fresh scan against the current rows, touching only added, removed and changed ones."""
+        current = {pkg["name"]: pkg for pkg in self._all_pkgs}
+        rows = []
+        changed = []
+        for pkg in packages:
+            row = current.get(pkg["name"])
+            if row is None or row["version"] != pkg["version"]:
+                row = self._new_row(pkg["name"], pkg["version"])
+                changed.append(pkg["name"])
+            rows.append(row)
+
+        self._all_pkgs = rows
+        self._pkg_index = {pkg["name"]: i for i, pkg in enumerate(rows)}
+        self._meta_cache = meta_cache
+        if self._selected_name not in self._pkg_index:
+            self._selected_name = None
+        self._render_visible_rows() # Deletes rows that went away, inserts new ones in view
+        for name in changed:
+            self._refresh_row(name) # Rows that stayed in the tree but changed version
+        self._scan_details([meta_cache[_normalize_name(name)] for name in changed])
+        self.set_status(f"Loaded {len(self._all_pkgs)} packages.")
+
+    def populate_initial_list(self, packages, meta_cache=None):
+        """Populates the tree with basic info (name, version) in the main thread (meta_cache is None if the scan failed)."""
+        self._all_pkgs = [self._new_row(pkg.get('name', 'Unknown'), pkg.get('version', 'N/A')) for pkg in packages or []]
+        self._pkg_index = {pkg["name"]: i for i, pkg in enumerate(self._all_pkgs)}
+        self._view_start = 0
         self.clear_tree()
-        if packages is None:
+        self._render_visible_rows() # One pass, inserting only the rows in view
+
+        if packages is None or meta_cache is None:
             self.set_status("Failed to load packages.")
             self._enable_buttons()
             return
 
-        total = len(packages)
-        for i, pkg in enumerate(packages):
-            name = pkg.get('name', 'Unknown')
-            version = pkg.get('version', 'N/A')
-            # Insert name into the values tuple now
-            self.tree.insert("", "end", iid=name, values=(name, version, "...", "...")) # Use name as item ID (iid)
-
-        self.set_status(f"Loaded {total} packages. Select a package to view details.")
+        self._meta_cache = meta_cache
+        self.set_status(f"Loaded {len(self._all_pkgs)} packages. Reading package sizes...")
         self._enable_buttons() # Re-enable buttons after list is populated
 
+        # Fill in every row's details with one background pass rather than one fetch per click
+        self._scan_details(list(meta_cache.values()))
+
     def on_package_select(self, event=None):
-        """Handles package selection: triggers detail fetching in a thread."""
+        """Handles package selection (details are filled in for every row by the background scan)."""
         selected_items = self.tree.selection()
         if not selected_items:
             return
 
         item_id = selected_items[0] # Get the first selected item's ID (which we set to the package name)
-        # Retrieve values for the selected item
-        current_values = self.tree.item(item_id, "values")
-        if not current_values: # Should not happen if selection is valid, but check anyway
-             return
-        package_name = current_values[0] # Name is now the first value
-
-        # Check if details are already loaded (or being loaded) by looking at Size/Dependencies columns
-        # Indices shift because name is now values[0]: Version=1, Size=2, Deps=3
-        if current_values[2] != "..." or current_values[3] != "...": # Check if size/deps are placeholders
-             # Details already loaded or loading, do nothing
-             # print(f"Details already loaded/loading for {package_name}")
-             return
-
-        self.set_status(f"Fetching details for {package_name}...")
-        # Set placeholders to indicate loading, keeping name and version
-        self.tree.item(item_id, values=(package_name, current_values[1], "Loading...", "Loading..."))
-
-        # Start thread to fetch details
-        thread = threading.Thread(target=self._get_details_worker, args=(item_id, package_name))
-        thread.start()
-
-    def _get_details_worker(self, item_id, package_name):
-        """Worker thread to fetch package details."""
-        version, size, dependencies = get_package_details(package_name)
-        # Send details back to main thread via queue
-        self.queue.put(("update_package_details", item_id, version, size, dependencies))
-
-    def update_package_details(self, item_id, version, size, dependencies):
-        """Updates the treeview item with fetched details in the main thread."""
-        try:
-            if self.tree.exists(item_id): # Check if item still exists
-                 # Get the package name again from the item_id (which is the name)
-                 # or retrieve current values to preserve the name column
-                 current_vals = self.tree.item(item_id, "values")
-                 package_name_in_tree = current_vals[0] # Get name from first column
-                 self.tree.item(item_id, values=(package_name_in_tree, version, size, ", ".join(dependencies) if dependencies else "-"))
-                 self.set_status(f"Details loaded for {package_name_in_tree}.")
-            else:
-                 print(f"Item {item_id} no longer exists in tree.") # Item might have been deleted by a refresh
-        except tk.TclError as e:
-             print(f"Error updating tree item {item_id}: {e}") # Catch potential Tcl errors if item is gone
+        if item_id in self._pkg_index:
+            self._selected_name = item_id
 
     def _disable_buttons(self):
         """Disables action buttons."""
         self.refresh_button.config(state=tk.DISABLED)
         self.install_button.config(state=tk.DISABLED)
+        self.check_updates_button.config(state=tk.DISABLED) # Needs the full list
     def _enable_buttons(self):
         """Enables action buttons."""
         self.refresh_button.config(state=tk.NORMAL)
@@ -344,14 +904,11 @@ class LibraryManagerApp:
         thread.start()
 
     def uninstall_package(self):
-        selected_items = self.tree.selection()
-        if not selected_items:
+        package_name = self._selected_package()
+        if not package_name:
             messagebox.showwarning("Selection Needed", "Please select a package to uninstall.")
             return
 
-        item_id = selected_items[0]
-        package_name = self.tree.item(item_id, "values")[0] # Get name from values
-
         if messagebox.askyesno("Confirm Uninstall", f"Are you sure you want to uninstall '{package_name}'?"):
             self.set_status(f"Uninstalling {package_name}...")
             self._disable_buttons()
@@ -359,66 +916,76 @@ class LibraryManagerApp:
             thread.start()
 
     def update_selected_package(self):
-        selected_items = self.tree.selection()
-        if not selected_items:
+        package_name = self._selected_package()
+        if not package_name:
             messagebox.showwarning("Selection Needed", "Please select a package to update.")
             return
 
-        item_id = selected_items[0]
-        package_name = self.tree.item(item_id, "values")[0] # Get name from values
-
         self.set_status(f"Updating {package_name}...")
         self._disable_buttons()
         thread = threading.Thread(target=self._pip_command_worker, args=(["install", "--upgrade", package_name], f"update_{package_name}"))
         thread.start()
 
     def check_all_updates_threaded(self):
+        if not self._all_pkgs:
+            messagebox.showwarning("No Packages", "The package list hasn't loaded yet.")
+            return
+
         self.set_status("Checking for all outdated packages...")
         self._disable_buttons()
-        thread = threading.Thread(target=self._check_all_updates_worker)
+        packages = [{"name": pkg["name"], "version": pkg["version"]} for pkg in self._all_pkgs]
+        thread = threading.Thread(target=self._check_all_updates_worker, args=(packages,))
         thread.start()
 
-    def _check_all_updates_worker(self):
-        """Worker thread to check for outdated packages."""
-        outdated = get_outdated_packages()
-        self.queue.put(("process_outdated_results", outdated))
+    def _check_all_updates_worker(self, packages):
+        """Worker thread to check for outdated packages, highlighting each one as it is found."""
+        outdated, failures = get_outdated_packages(packages, on_outdated=lambda pkg: self._post("outdated_found", pkg))
+        self._post("process_outdated_results", outdated, failures)
 
-    def process_outdated_results(self, outdated):
-        """Handles the list of outdated packages in the main thread."""
+    def process_outdated_results(self, outdated, failures=0):
+        """Handles the list of outdated packages in the main thread (failures: packages that couldn't be checked)."""
         self._enable_buttons() # Re-enable buttons first
 
         if outdated is None: # Error occurred during check
             self.set_status("Failed to check for updates.")
             return
 
+        # A partial result must not pass for a complete one
+        unchecked = f"{failures} packages could not be checked (see console)." if failures else ""
+
         if not outdated:
-            self.set_status("All packages are up-to-date.")
-            messagebox.showinfo("Updates", "All packages are up-to-date.")
+            if unchecked:
+                self.set_status(f"No updates found, but {unchecked}")
+                messagebox.showwarning("Updates", f"No updates found, but {unchecked}")
+            else:
+                self.set_status("All packages are up-to-date.")
+                messagebox.showinfo("Updates", "All packages are up-to-date.")
             return
 
         outdated_info = "\n".join([f"- {pkg['name']} ({pkg['version']} -> {pkg['latest_version']})" for pkg in outdated])
+        if unchecked:
+            outdated_info += f"\n\n{unchecked}"
 
-        # Highlight outdated rows
-        self._highlight_outdated(outdated)
+        # Rows were highlighted as results came in (outdated_found)
 
         # Ask user if they want to update all
         if messagebox.askyesno("Updates Available", f"Found {len(outdated)} outdated packages:\n{outdated_info}\n\nDo you want to update all of them?"):
             self.update_multiple_packages_threaded(outdated)
         else:
-            self.set_status(f"{len(outdated)} updates available. Outdated packages highlighted.")
-
-    
-
-        # Apply tag to outdated items (Ensure this loop is at the correct indentation)
-        for item_id in self.tree.get_children():
-            values = self.tree.item(item_id, "values")
-            if not values: continue # Skip if item somehow has no values
-            package_name = values[0] # Get name from values
-            if package_name in outdated_names: # Ensure this block is indented correctly
-                current_tags = list(self.tree.item(item_id, "tags"))
-                if "outdated_row" not in current_tags: # Ensure this block is indented correctly
-                    current_tags.append("outdated_row")
-                    self.tree.item(item_id, tags=tuple(current_tags))
+            self.set_status(f"{len(outdated)} updates available. Outdated packages highlighted. {unchecked}".rstrip())
+
+    def _highlight_outdated(self, outdated):
+        """Tags the rows of outdated packages (rows rendered later pick the tag up from _all_pkgs)."""
+        outdated_names = frozenset(pkg['name'] for pkg in outdated)
+        for package_name in outdated_names:
+            index = self._pkg_index.get(package_name)
+            if index is None:
+                continue
+            self._all_pkgs[index]["outdated"] = True
+            try:
+                self.tree.item(package_name, tags=("outdated_row",))
+            except tk.TclError:
+                pass # Scrolled out of view, tagged when rendered
 
     def update_multiple_packages_threaded(self, packages_to_update):
         """Starts a thread to update multiple packages."""
@@ -431,18 +998,24 @@ class LibraryManagerApp:
         thread.start()
 
     def _pip_command_worker(self, command, action_id):
-        """Generic worker thread for running pip commands."""
-        success = run_pip_command(command)
+        """Generic worker thread for running pip commands, showing pip's output live in the status bar."""
+        success, output_tail = run_pip_streaming(command, self.set_status)
+        error_message = None
+        if not success:
+            error_message = f"Error running command: {' '.join(command)}\n" + "\n".join(output_tail)
         # Send result back to main thread via queue
-        self.queue.put(("pip_command_complete", action_id, success, command))
+        self._post("pip_command_complete", action_id, success, command, error_message)
 
-    def process_pip_command_result(self, action_id, success, command):
+    def process_pip_command_result(self, action_id, success, command, error_message=None):
         """Handles the result of a pip command in the main thread."""
         self._enable_buttons() # Always re-enable buttons
 
-        action_parts = action_id.split('_', 1)
-        action_type = action_parts[0]
-        package_name = action_parts[1] if len(action_parts) > 1 else None
+        if action_id == "update_multiple":
+            action_type, package_name = action_id, None
+        else:
+            action_parts = action_id.split('_', 1)
+            action_type = action_parts[0]
+            package_name = action_parts[1] if len(action_parts) > 1 else None
 
         if success:
             message = "Operation successful."
@@ -456,40 +1029,61 @@ class LibraryManagerApp:
                  message = f"{len(command) - 2} packages updated successfully." # command = ['install', '--upgrade', pkg1, pkg2,...]
 
             messagebox.showinfo("Success", message)
-            self.refresh_package_list_threaded() # Refresh list on success
+            # Apply just what changed instead of rebuilding the list
+            if action_type == "uninstall":
+                self._remove_package(package_name)
+            else: # install and update may pull in or upgrade dependencies too
+                self._reconcile_package_list()
         else:
-            # Error message should have been shown by run_pip_command
+            if error_message:
+                messagebox.showerror("Pip Error", error_message)
             self.set_status(f"Failed to {action_type} {package_name or 'packages'}. See error popup.")
 
     # --- Queue Processor ---
-    def process_queue(self):
-        """Processes messages from the worker threads."""
+    def _post(self, *message):
+        """Queues a message for the main thread and wakes it (safe to call from any thread)."""
+        self.queue.put(message)
+        if self._closed: # A pip command may outlive the window; Tk calls from its thread would block
+            return
         try:
-            while True: # Process all messages currently in the queue
+            self.root.event_generate("<<QueueMsg>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            pass # Main loop not running (yet, or any more); the after_idle drain picks it up
+
+    def _drain_queue(self):
+        """Processes messages from the worker threads."""
+        while True: # Process all messages currently in the queue
+            try:
                 message = self.queue.get_nowait()
-                msg_type = message[0]
-                args = message[1:]
+            except Empty:
+                break
+            msg_type = message[0]
+            args = message[1:]
 
-                if msg_type == "populate_initial_list":
+            # Nothing re-polls the queue any more, so one bad message mustn't strand the rest
+            try:
+                if msg_type == "status":
+                    self.status_var.set(*args)
+                elif msg_type == "populate_initial_list":
                     self.populate_initial_list(*args)
-                elif msg_type == "update_package_details":
-                    self.update_package_details(*args)
+                elif msg_type == "reconcile_package_list":
+                    self.reconcile_package_list(*args)
+                elif msg_type == "update_all_details":
+                    self.update_all_details(*args)
+                elif msg_type == "outdated_found":
+                    self._highlight_outdated(args)
                 elif msg_type == "process_outdated_results":
                     self.process_outdated_results(*args)
                 elif msg_type == "pip_command_complete":
                     self.process_pip_command_result(*args)
                 # Add other message types as needed
-
-        except Exception as e: # Use generic Exception to catch queue.Empty and others
-            if "queue.Empty" not in str(type(e)): # Ignore queue empty error
-                 print(f"Error processing queue: {e}")
-
-        # Reschedule after processing
-        self.root.after(100, self.process_queue)
+            except Exception as e:
+                print(f"Error processing queue: {e}")
 
 
 # --- Main Execution ---
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Worker pool support for frozen Windows builds
     root = tk.Tk()
     app = LibraryManagerApp(root)
     root.mainloop()